@@ -1,7 +1,8 @@
 """ Definition of packets and binary formats from QTM """
 
 from collections import namedtuple
-from functools import wraps
+from collections.abc import Mapping
+from functools import lru_cache
 import struct
 
 from enum import Enum
@@ -18,6 +19,11 @@ RTCommand = "<II%dsc"
 RTDataQRTPacket = struct.Struct("<qII")
 RTComponentData = struct.Struct("<II")
 
+_HDR_UNPACK = RTDataQRTPacket.unpack_from
+_HDR_SIZE = RTDataQRTPacket.size
+_COMP_UNPACK = RTComponentData.unpack_from
+_COMP_SIZE = RTComponentData.size
+
 # 2D
 RT2DComponent = namedtuple("RT2DComponent", "camera_count drop_rate out_of_sync_rate")
 RT2DComponent.format = struct.Struct("<Ihh")
@@ -62,6 +68,12 @@ RT6DBodyResidual.format = struct.Struct("<f")
 RT6DBodyEuler = namedtuple("RT6DBodyEuler", "a1 a2 a3")
 RT6DBodyEuler.format = struct.Struct("<3f")
 
+# Complete bodies, so all bodies in a component can be parsed in one pass
+_RT6DBody = struct.Struct("<3f9f")
+_RT6DBodyResidual = struct.Struct("<3f9ff")
+_RT6DBodyEuler = struct.Struct("<3f3f")
+_RT6DBodyEulerResidual = struct.Struct("<3f3ff")
+
 # Analog
 RTAnalogComponent = namedtuple("RTAnalogComponent", "device_count")
 RTAnalogComponent.format = struct.Struct("<i")
@@ -81,6 +93,13 @@ RTAnalogDeviceSingle.format = struct.Struct("<ii")
 RTAnalogDeviceSamples = namedtuple("RTAnalogDeviceSamples", "samples")
 RTAnalogDeviceSamples.format_str = "<%df"
 
+
+@lru_cache(maxsize=64)
+def _analog_samples_struct(format_str, sample_count):
+    """ Compiled struct for a block of analog samples, cached by sample count """
+    return struct.Struct(format_str % sample_count)
+
+
 # Force
 RTForceComponent = namedtuple("RTForceComponent", "plate_count")
 RTForceComponent.format = struct.Struct("<i")
@@ -94,6 +113,9 @@ RTForcePlateSingle.format = struct.Struct("<i")
 RTForce = namedtuple("RTForce", "x y z x_m y_m z_m x_a y_a z_a")
 RTForce.format = struct.Struct("<9f")
 
+# Plate id and force, so all single force plates can be parsed in one pass
+_RTForcePlateSingleForce = struct.Struct("<i9f")
+
 # GazeVector
 RTGazeVectorComponent = namedtuple("RTGazeVectorComponent", "vector_count")
 RTGazeVectorComponent.format = struct.Struct("<i")
@@ -121,6 +143,9 @@ RTSegmentPosition.format = struct.Struct("<3f")
 RTSegmentRotation = namedtuple("RTSegmentRotation", "x y z w")
 RTSegmentRotation.format = struct.Struct("<4f")
 
+# Complete segments, so all segments in a skeleton can be parsed in one pass
+_RTSegment = struct.Struct("<i3f4f")
+
 RTImage = namedtuple(
     "RTImage",
     "id format width height left_crop top_crop right_crop bottom_crop image_size",
@@ -135,6 +160,45 @@ RTTimeComponent.format = struct.Struct("<i")
 RTTime = namedtuple("RTTime", "type hi lo")
 RTTime.format = struct.Struct("<iII")
 
+# Bind format lookups used by QRTPacket._get_exact once instead of per value
+for _component_type in (
+    RT2DComponent,
+    RT2DCamera,
+    RT2DMarker,
+    RT3DComponent,
+    RT3DMarkerPosition,
+    RT3DMarkerPositionResidual,
+    RT3DMarkerPositionNoLabel,
+    RT3DMarkerPositionNoLabelResidual,
+    RT6DComponent,
+    RT6DBodyPosition,
+    RT6DBodyRotation,
+    RT6DBodyResidual,
+    RT6DBodyEuler,
+    RTAnalogComponent,
+    RTAnalogDevice,
+    RTSampleNumber,
+    RTAnalogDeviceSingle,
+    RTForceComponent,
+    RTForcePlate,
+    RTForcePlateSingle,
+    RTForce,
+    RTGazeVectorComponent,
+    RTGazeVector,
+    RTImageComponent,
+    RTSkeletonComponent,
+    RTSegmentCount,
+    RTSegmentId,
+    RTSegmentPosition,
+    RTSegmentRotation,
+    RTImage,
+    RTTimeComponent,
+    RTTime,
+):
+    _component_type._unpack_from = _component_type.format.unpack_from
+    _component_type._size = _component_type.format.size
+del _component_type
+
 
 class QRTPacketType(Enum):
     """ Packet types """
@@ -207,39 +271,67 @@ class QRTEvent(Enum):
     )  # Must be the last. Not actually an event. Just used to count number of events.
 
 
-class ComponentGetter(object):
-    """ Helper decorator for extracting correct packet data based on type """
+# Value to member lookups, cheaper than calling the Enum for every packet
+_PACKET_TYPE_BY_INT = {member.value: member for member in QRTPacketType}
+_EVENT_BY_INT = {member.value: member for member in QRTEvent}
 
-    def __init__(self, component_enum, base_component):
-        self.component_enum = component_enum
-        self.base_component = base_component
 
-    def __call__(self, function):
-        @wraps(function)
-        def wrapper(*args, **kwargs):
-            calling_object = args[0]
-            component_position = calling_object.components.get(
-                self.component_enum, None
-            )
-            if component_position is None:
-                return None
+def packet_type_from_int(value):
+    """ Same as QRTPacketType(value) but faster, raises ValueError if unknown """
+    try:
+        return _PACKET_TYPE_BY_INT[value]
+    except KeyError:
+        raise ValueError("{} is not a valid QRTPacketType".format(value))
 
-            component_position, component_info = QRTPacket._get_exact(
-                self.base_component, calling_object.data, component_position
-            )
 
-            return (
-                component_info,
-                function(
-                    *args,
-                    component_info=component_info,
-                    data=calling_object.data,
-                    component_position=component_position,
-                    **kwargs
-                ),
-            )
+def event_from_int(value):
+    """ Same as QRTEvent(value) but faster, raises ValueError if unknown """
+    try:
+        return _EVENT_BY_INT[value]
+    except KeyError:
+        raise ValueError("{} is not a valid QRTEvent".format(value))
+
+# Component positions are stored in a list indexed by component type value,
+# component type values run from 1 up to the length of the list
+_NO_COMPONENT_POSITIONS = [-1] * (max(member.value for member in QRTComponentType) + 1)
+
 
-        return wrapper
+class _ComponentPositions(Mapping):
+    """ Read only mapping of component type to position, backed by a list """
+
+    __slots__ = ("_positions",)
+
+    def __init__(self, positions):
+        self._positions = positions
+
+    def __getitem__(self, component):
+        if not isinstance(component, QRTComponentType):
+            raise KeyError(component)
+        position = self._positions[component.value]
+        if position < 0:
+            raise KeyError(component)
+        return position
+
+    def __contains__(self, component):
+        return (
+            isinstance(component, QRTComponentType)
+            and self._positions[component.value] >= 0
+        )
+
+    def __iter__(self):
+        # Positions grow through the packet, so sorting on them gives wire order
+        found = sorted(
+            (position, value)
+            for value, position in enumerate(self._positions)
+            if position >= 0
+        )
+        return (QRTComponentType(value) for _, value in found)
+
+    def __len__(self):
+        return sum(position >= 0 for position in self._positions)
+
+    def __repr__(self):
+        return repr(dict(self))
 
 
 # noinspection PyTypeChecker
@@ -256,88 +348,218 @@ class QRTPacket(object):
 
     Component retriever functions will return None if a component is not in the packet.
 
+    Parsed values are plain (named) tuples, so they can be handed straight to
+    numpy, for example ``numpy.array(markers)`` for an array of shape
+    (marker count, 3) or ``numpy.array(rotation.matrix)`` for the 9 rotation
+    matrix elements of a 6D body.
+
+    When handling many packets per second, packets can be recycled with
+    :meth:`acquire` and :meth:`release` instead of creating new ones:
+
+    ::
+
+        packet = QRTPacket.acquire(data)
+        header, markers = packet.get_3d_markers()
+        packet.release()
+
+    Pass ``eager=True`` to parse every component when the packet is created
+    and drop the reference to the raw packet data. Getters then return the
+    already parsed components. The raw data is kept if the packet contains
+    a component without a getter, such as gaze vectors.
+
     """
 
-    def __init__(self, data):
+    _pool = []
+    _pool_size = 16
+
+    def __init__(self, data, eager=False):
+        self._positions = list(_NO_COMPONENT_POSITIONS)
+        self.components = _ComponentPositions(self._positions)
+        self._eager = eager
+        self.reset(data)
+
+    @classmethod
+    def acquire(cls, data, eager=False):
+        """Get a packet for data, reusing a released packet if one is available."""
+        try:
+            packet = cls._pool.pop()
+        except IndexError:
+            return cls(data, eager=eager)
+        packet._eager = eager
+        packet.reset(data)
+        return packet
+
+    def release(self):
+        """Return the packet to the pool used by :meth:`acquire`.
+
+        The packet, and anything returned from it that references packet data
+        such as image memoryviews, must not be used after it has been released.
+        Releasing an already released packet does nothing.
+        """
+        if self._released:
+            return
+        self._released = True
+        self.data = None
+        self._parsed = None
+        pool = type(self)._pool
+        if len(pool) < type(self)._pool_size:
+            pool.append(self)
+
+    def reset(self, data):
+        """Reuse the packet for new packet data.
+
+        :raises ValueError: If the data contains an unknown component type.
+        """
+        self._released = False
         self.data = data
 
-        self.timestamp, self.framenumber, component_count = RTDataQRTPacket.unpack_from(
-            data, 0
-        )
+        self.timestamp, self.framenumber, component_count = _HDR_UNPACK(data)
 
-        self.components = {}
-        position = RTDataQRTPacket.size
+        positions = self._positions
+        positions[:] = _NO_COMPONENT_POSITIONS
+        slot_count = len(positions)
+        unpack_component = _COMP_UNPACK
+        position = _HDR_SIZE
         for _ in range(component_count):
-            c_size, c_type = RTComponentData.unpack_from(data, position)
-            self.components[QRTComponentType(c_type)] = position + RTComponentData.size
+            c_size, c_type = unpack_component(data, position)
+            if not 0 < c_type < slot_count:
+                raise ValueError("Unknown component type: {}".format(c_type))
+            positions[c_type] = position + _COMP_SIZE
             position += c_size
 
+        self._parsed = None
+        if self._eager:
+            self._parsed = self._parse_all()
+            if all(self._getters[component] for component in self.components):
+                self.data = None
+
+    def _parse_all(self):
+        parsed = {}
+        for component in self.components:
+            getter = self._getters[component]
+            if getter is not None:
+                parsed[component] = getter(self)
+
+        images = parsed.get(QRTComponentType.ComponentImage)
+        if images is not None:
+            # Views into the packet data would keep it alive, view copies instead
+            component_info, image_list = images
+            parsed[QRTComponentType.ComponentImage] = (
+                component_info,
+                [
+                    (image_info, memoryview(bytes(image)))
+                    for image_info, image in image_list
+                ],
+            )
+        return parsed
+
+    @staticmethod
+    def _select_camera(parsed, index):
+        if parsed is None or index is None:
+            return parsed
+        component_info, cameras = parsed
+        return component_info, cameras[index : index + 1] if index >= 0 else []
+
+    def _get_header(self, component_enum, base_component):
+        component_position = self._positions[component_enum.value]
+        if component_position < 0:
+            return None
+        return QRTPacket._get_exact(base_component, self.data, component_position)
+
     @staticmethod
     def _get_exact(component_type, data, position):
-        value = component_type._make(component_type.format.unpack_from(data, position))
-        position += component_type.format.size
-        return position, value
+        value = component_type._make(component_type._unpack_from(data, position))
+        return position + component_type._size, value
 
     @staticmethod
-    def _get_tuple(component_type, data, position):
-        value = component_type._make(
-            [component_type.format.unpack_from(data, position)]
-        )
-        position += component_type.format.size
-        return position, value
+    def _get_raw(format_, data, position):
+        return position + format_.size, format_.unpack_from(data, position)
+
+    @staticmethod
+    def _iter_unpack(format_, count, data, position):
+        end = position + format_.size * count
+        if end > len(data):
+            raise struct.error(
+                "iter_unpack requires a buffer of {} bytes at offset {}".format(
+                    end - position, position
+                )
+            )
+        return format_.iter_unpack(data[position:end])
 
     @staticmethod
     def _get_2d_markers(data, component_info, component_position, index=None):
+        make_marker = RT2DMarker._make
+        marker_size = RT2DMarker.format.size
+
         components = []
-        append_components = components.append
         for camera in range(component_info.camera_count):
             component_position, camera_info = QRTPacket._get_exact(
                 RT2DCamera, data, component_position
             )
 
             if index is None or index == camera:
-                marker_list = []
-                append_marker = marker_list.append
-                append_components(marker_list)
+                markers = QRTPacket._iter_unpack(
+                    RT2DMarker.format,
+                    camera_info.marker_count,
+                    data,
+                    component_position,
+                )
+                components.append(list(map(make_marker, markers)))
 
-                for _ in range(camera_info.marker_count):
-                    component_position, marker = QRTPacket._get_exact(
-                        RT2DMarker, data, component_position
-                    )
-                    append_marker(marker)
-            else:
-                component_position += RT2DMarker.format.size * camera_info.marker_count
+                # Remaining cameras are not wanted, skip parsing their headers
+                if index is not None:
+                    break
+
+            component_position += marker_size * camera_info.marker_count
 
         return components
 
     @staticmethod
     def _get_3d_markers(type_, component_info, data, component_position):
-        components = []
-        append_components = components.append
-        for _ in range(component_info.marker_count):
-            component_position, position = QRTPacket._get_exact(
-                type_, data, component_position
+        return list(
+            map(
+                type_._make,
+                QRTPacket._iter_unpack(
+                    type_.format, component_info.marker_count, data, component_position
+                ),
             )
-            append_components(position)
+        )
 
-        return components
+    def get_timecode(self):
+        """Get timecode."""
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.ComponentTimecode)
+
+        header = self._get_header(QRTComponentType.ComponentTimecode, RTTimeComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, list(
+            map(
+                RTTime._make,
+                QRTPacket._iter_unpack(
+                    RTTime.format,
+                    component_info.timecode_count,
+                    data,
+                    component_position,
+                ),
+            )
+        )
 
-    @ComponentGetter(QRTComponentType.ComponentTimecode, RTTimeComponent)
-    def get_timecode(self, component_info=None, data=None, component_position=None):
-        components = []
-        append_components = components.append
-        for _ in range(component_info.timecode_count):
-            time_component, timecode = QRTPacket._get_exact(
-                RTTime, data, component_position)
-            append_components(timecode)
+    def get_analog(self):
+        """Get analog data."""
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.ComponentAnalog)
 
-        return components
+        header = self._get_header(QRTComponentType.ComponentAnalog, RTAnalogComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
 
-    @ComponentGetter(QRTComponentType.ComponentAnalog, RTAnalogComponent)
-    def get_analog(self, component_info=None, data=None, component_position=None):
-        """Get analog data."""
         components = []
-        append_components = components.append
         for _ in range(component_info.device_count):
             component_position, device = QRTPacket._get_exact(
                 RTAnalogDevice, data, component_position
@@ -347,237 +569,374 @@ class QRTPacket(object):
                     RTSampleNumber, data, component_position
                 )
 
-                RTAnalogChannel.format = struct.Struct(
-                    RTAnalogChannel.format_str % device.sample_count
+                # All channels of a device are stored back to back, read them at once
+                sample_count = device.sample_count
+                component_position, samples = QRTPacket._get_raw(
+                    _analog_samples_struct(
+                        RTAnalogChannel.format_str, device.channel_count * sample_count
+                    ),
+                    data,
+                    component_position,
                 )
-                for _ in range(device.channel_count):
-                    component_position, channel = QRTPacket._get_tuple(
-                        RTAnalogChannel, data, component_position
+                components.extend(
+                    (
+                        device,
+                        sample_number,
+                        RTAnalogChannel(samples[start : start + sample_count]),
                     )
-                    append_components((device, sample_number, channel))
+                    for start in range(0, len(samples), sample_count)
+                )
 
-        return components
+        return component_info, components
 
-    @ComponentGetter(QRTComponentType.ComponentAnalogSingle, RTAnalogComponent)
-    def get_analog_single(
-        self, component_info=None, data=None, component_position=None
-    ):
+    def get_analog_single(self):
         """Get a single analog data channel."""
-        components = []
-        append_components = components.append
-        for _ in range(component_info.device_count):
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.ComponentAnalogSingle)
+
+        header = self._get_header(
+            QRTComponentType.ComponentAnalogSingle, RTAnalogComponent
+        )
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        components = [None] * component_info.device_count
+        for i in range(component_info.device_count):
             component_position, device = QRTPacket._get_exact(
                 RTAnalogDeviceSingle, data, component_position
             )
 
-            RTAnalogDeviceSamples.format = struct.Struct(
-                RTAnalogDeviceSamples.format_str % device.channel_count
+            samples_format = _analog_samples_struct(
+                RTAnalogDeviceSamples.format_str, device.channel_count
             )
-            component_position, sample = QRTPacket._get_tuple(
-                RTAnalogDeviceSamples, data, component_position
+            component_position, samples = QRTPacket._get_raw(
+                samples_format, data, component_position
             )
-            append_components((device, sample))
-        return components
+            components[i] = (device, RTAnalogDeviceSamples(samples))
+        return component_info, components
 
-    @ComponentGetter(QRTComponentType.ComponentForce, RTForceComponent)
-    def get_force(self, component_info=None, data=None, component_position=None):
+    def get_force(self):
         """Get force data."""
-        components = []
-        append_components = components.append
-        for _ in range(component_info.plate_count):
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.ComponentForce)
+
+        header = self._get_header(QRTComponentType.ComponentForce, RTForceComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        components = [None] * component_info.plate_count
+        for i in range(component_info.plate_count):
             component_position, plate = QRTPacket._get_exact(
                 RTForcePlate, data, component_position
             )
-            force_list = []
-            for _ in range(plate.force_count):
-                component_position, force = QRTPacket._get_exact(
-                    RTForce, data, component_position
+            force_list = list(
+                map(
+                    RTForce._make,
+                    QRTPacket._iter_unpack(
+                        RTForce.format, plate.force_count, data, component_position
+                    ),
                 )
-                force_list.append(force)
-            append_components((plate, force_list))
-        return components
+            )
+            component_position += RTForce.format.size * plate.force_count
+            components[i] = (plate, force_list)
+        return component_info, components
 
-    @ComponentGetter(QRTComponentType.ComponentForceSingle, RTForceComponent)
-    def get_force_single(self, component_info=None, data=None, component_position=None):
+    def get_force_single(self):
         """Get a single force data channel."""
-        components = []
-        append_components = components.append
-        for _ in range(component_info.plate_count):
-            component_position, plate = QRTPacket._get_exact(
-                RTForcePlateSingle, data, component_position
-            )
-            component_position, force = QRTPacket._get_exact(
-                RTForce, data, component_position
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.ComponentForceSingle)
+
+        header = self._get_header(
+            QRTComponentType.ComponentForceSingle, RTForceComponent
+        )
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, [
+            (RTForcePlateSingle(plate[0]), RTForce._make(plate[1:]))
+            for plate in QRTPacket._iter_unpack(
+                _RTForcePlateSingleForce,
+                component_info.plate_count,
+                data,
+                component_position,
             )
-            append_components((plate, force))
-        return components
+        ]
 
-    @ComponentGetter(QRTComponentType.Component6d, RT6DComponent)
-    def get_6d(self, component_info=None, data=None, component_position=None):
+    def get_6d(self):
         """Get 6D data."""
-        components = []
-        append_components = components.append
-        for _ in range(component_info.body_count):
-            component_position, position = QRTPacket._get_exact(
-                RT6DBodyPosition, data, component_position
-            )
-            component_position, matrix = QRTPacket._get_tuple(
-                RT6DBodyRotation, data, component_position
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.Component6d)
+
+        header = self._get_header(QRTComponentType.Component6d, RT6DComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, [
+            (RT6DBodyPosition._make(body[:3]), RT6DBodyRotation(body[3:]))
+            for body in QRTPacket._iter_unpack(
+                _RT6DBody, component_info.body_count, data, component_position
             )
-            append_components((position, matrix))
-        return components
+        ]
 
-    @ComponentGetter(QRTComponentType.Component6dRes, RT6DComponent)
-    def get_6d_residual(self, component_info=None, data=None, component_position=None):
+    def get_6d_residual(self):
         """Get 6D data with residual."""
-        components = []
-        append_components = components.append
-        for _ in range(component_info.body_count):
-            component_position, position = QRTPacket._get_exact(
-                RT6DBodyPosition, data, component_position
-            )
-            component_position, matrix = QRTPacket._get_tuple(
-                RT6DBodyRotation, data, component_position
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.Component6dRes)
+
+        header = self._get_header(QRTComponentType.Component6dRes, RT6DComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, [
+            (
+                RT6DBodyPosition._make(body[:3]),
+                RT6DBodyRotation(body[3:12]),
+                RT6DBodyResidual(body[12]),
             )
-            component_position, residual = QRTPacket._get_exact(
-                RT6DBodyResidual, data, component_position
+            for body in QRTPacket._iter_unpack(
+                _RT6DBodyResidual, component_info.body_count, data, component_position
             )
-            append_components((position, matrix, residual))
-        return components
+        ]
 
-    @ComponentGetter(QRTComponentType.Component6dEuler, RT6DComponent)
-    def get_6d_euler(self, component_info=None, data=None, component_position=None):
+    def get_6d_euler(self):
         """Get 6D data with euler rotations."""
-        components = []
-        append_components = components.append
-        for _ in range(component_info.body_count):
-            component_position, position = QRTPacket._get_exact(
-                RT6DBodyPosition, data, component_position
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.Component6dEuler)
+
+        header = self._get_header(QRTComponentType.Component6dEuler, RT6DComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, [
+            (RT6DBodyPosition._make(body[:3]), RT6DBodyEuler._make(body[3:]))
+            for body in QRTPacket._iter_unpack(
+                _RT6DBodyEuler, component_info.body_count, data, component_position
             )
-            component_position, euler = QRTPacket._get_exact(
-                RT6DBodyEuler, data, component_position
-            )
-            append_components((position, euler))
-        return components
+        ]
 
-    @ComponentGetter(QRTComponentType.Component6dEulerRes, RT6DComponent)
-    def get_6d_euler_residual(
-        self, component_info=None, data=None, component_position=None
-    ):
+    def get_6d_euler_residual(self):
         """Get 6D data with residuals and euler rotations."""
-        components = []
-        append_components = components.append
-        for _ in range(component_info.body_count):
-            component_position, position = QRTPacket._get_exact(
-                RT6DBodyPosition, data, component_position
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.Component6dEulerRes)
+
+        header = self._get_header(QRTComponentType.Component6dEulerRes, RT6DComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, [
+            (
+                RT6DBodyPosition._make(body[:3]),
+                RT6DBodyEuler._make(body[3:6]),
+                RT6DBodyResidual(body[6]),
             )
-            component_position, euler = QRTPacket._get_exact(
-                RT6DBodyEuler, data, component_position
+            for body in QRTPacket._iter_unpack(
+                _RT6DBodyEulerResidual,
+                component_info.body_count,
+                data,
+                component_position,
             )
-            component_position, residual = QRTPacket._get_exact(
-                RT6DBodyResidual, data, component_position
-            )
-            append_components((position, euler, residual))
-        return components
+        ]
 
-    @ComponentGetter(QRTComponentType.ComponentImage, RTImageComponent)
-    def get_image(self, component_info=None, data=None, component_position=None):
-        """Get image."""
-        components = []
-        append_components = components.append
-        for _ in range(component_info.image_count):
+    def get_image(self):
+        """Get image.
+
+        Image data is returned as a memoryview. It points into the packet data,
+        or into a copy of the image for packets created with ``eager=True``.
+        Use ``bytes()`` to get a copy that outlives a released packet.
+        """
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.ComponentImage)
+
+        header = self._get_header(QRTComponentType.ComponentImage, RTImageComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        components = [None] * component_info.image_count
+        for i in range(component_info.image_count):
             component_position, image_info = QRTPacket._get_exact(
                 RTImage, data, component_position
             )
-            append_components((image_info, data[component_position:-1]))
-        return components
+            end = component_position + image_info.image_size
+            components[i] = (image_info, data[component_position:end])
+            component_position = end
+        return component_info, components
 
-    @ComponentGetter(QRTComponentType.Component3d, RT3DComponent)
-    def get_3d_markers(self, component_info=None, data=None, component_position=None):
+    def get_3d_markers(self):
         """Get 3D markers."""
-        return self._get_3d_markers(
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.Component3d)
+
+        header = self._get_header(QRTComponentType.Component3d, RT3DComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, self._get_3d_markers(
             RT3DMarkerPosition, component_info, data, component_position
         )
 
-    @ComponentGetter(QRTComponentType.Component3dRes, RT3DComponent)
-    def get_3d_markers_residual(
-        self, component_info=None, data=None, component_position=None
-    ):
+    def get_3d_markers_residual(self):
         """Get 3D markers with residual."""
-        return self._get_3d_markers(
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.Component3dRes)
+
+        header = self._get_header(QRTComponentType.Component3dRes, RT3DComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, self._get_3d_markers(
             RT3DMarkerPositionResidual, component_info, data, component_position
         )
 
-    @ComponentGetter(QRTComponentType.Component3dNoLabels, RT3DComponent)
-    def get_3d_markers_no_label(
-        self, component_info=None, data=None, component_position=None
-    ):
+    def get_3d_markers_no_label(self):
         """Get 3D markers without label."""
-        return self._get_3d_markers(
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.Component3dNoLabels)
+
+        header = self._get_header(QRTComponentType.Component3dNoLabels, RT3DComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, self._get_3d_markers(
             RT3DMarkerPositionNoLabel, component_info, data, component_position
         )
 
-    @ComponentGetter(QRTComponentType.Component3dNoLabelsRes, RT3DComponent)
-    def get_3d_markers_no_label_residual(
-        self, component_info=None, data=None, component_position=None
-    ):
+    def get_3d_markers_no_label_residual(self):
         """Get 3D markers without label with residual."""
-        return self._get_3d_markers(
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.Component3dNoLabelsRes)
+
+        header = self._get_header(
+            QRTComponentType.Component3dNoLabelsRes, RT3DComponent
+        )
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, self._get_3d_markers(
             RT3DMarkerPositionNoLabelResidual, component_info, data, component_position
         )
 
-    @ComponentGetter(QRTComponentType.Component2d, RT2DComponent)
-    def get_2d_markers(
-        self, component_info=None, data=None, component_position=None, index=None
-    ):
+    def get_2d_markers(self, index=None):
         """Get 2D markers.
 
         :param index: Specify which camera to get 2D from, will be returned as
                       first entry in the returned array.
         """
-        return self._get_2d_markers(
+        if self._parsed is not None:
+            return self._select_camera(
+                self._parsed.get(QRTComponentType.Component2d), index
+            )
+
+        header = self._get_header(QRTComponentType.Component2d, RT2DComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        return component_info, self._get_2d_markers(
             data, component_info, component_position, index=index
         )
 
-    @ComponentGetter(QRTComponentType.Component2dLin, RT2DComponent)
-    def get_2d_markers_linearized(
-        self, component_info=None, data=None, component_position=None, index=None
-    ):
+    def get_2d_markers_linearized(self, index=None):
         """Get 2D linearized markers.
 
         :param index: Specify which camera to get 2D from, will be returned as
                       first entry in the returned array.
         """
+        if self._parsed is not None:
+            return self._select_camera(
+                self._parsed.get(QRTComponentType.Component2dLin), index
+            )
+
+        header = self._get_header(QRTComponentType.Component2dLin, RT2DComponent)
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
 
-        return self._get_2d_markers(
+        return component_info, self._get_2d_markers(
             data, component_info, component_position, index=index
         )
 
-    @ComponentGetter(QRTComponentType.ComponentSkeleton, RTSkeletonComponent)
-    def get_skeletons(self, component_info=None, data=None, component_position=None):
+    def get_skeletons(self):
         """Get skeletons
         """
+        if self._parsed is not None:
+            return self._parsed.get(QRTComponentType.ComponentSkeleton)
 
-        components = []
-        append_components = components.append
-        for _ in range(component_info.skeleton_count):
+        header = self._get_header(
+            QRTComponentType.ComponentSkeleton, RTSkeletonComponent
+        )
+        if header is None:
+            return None
+        component_position, component_info = header
+        data = memoryview(self.data)
+
+        components = [None] * component_info.skeleton_count
+        for i in range(component_info.skeleton_count):
             component_position, info = QRTPacket._get_exact(
                 RTSegmentCount, data, component_position
             )
 
-            segments = []
-            for __ in range(info.segment_count):
-                component_position, segment = QRTPacket._get_exact(
-                    RTSegmentId, data, component_position
-                )
-                component_position, position = QRTPacket._get_exact(
-                    RTSegmentPosition, data, component_position
+            segments = [
+                (
+                    segment[0],
+                    RTSegmentPosition._make(segment[1:4]),
+                    RTSegmentRotation._make(segment[4:]),
                 )
-                component_position, rotation = QRTPacket._get_exact(
-                    RTSegmentRotation, data, component_position
+                for segment in QRTPacket._iter_unpack(
+                    _RTSegment, info.segment_count, data, component_position
                 )
-
-                segments.append((segment.id, position, rotation))
-            append_components(segments)
-        return components
-
+            ]
+            component_position += _RTSegment.size * info.segment_count
+            components[i] = segments
+        return component_info, components
+
+    # Getter used by eager parsing for each component type
+    _getters = {
+        QRTComponentType.ComponentTimecode: get_timecode,
+        QRTComponentType.ComponentAnalog: get_analog,
+        QRTComponentType.ComponentAnalogSingle: get_analog_single,
+        QRTComponentType.ComponentForce: get_force,
+        QRTComponentType.ComponentForceSingle: get_force_single,
+        QRTComponentType.Component6d: get_6d,
+        QRTComponentType.Component6dRes: get_6d_residual,
+        QRTComponentType.Component6dEuler: get_6d_euler,
+        QRTComponentType.Component6dEulerRes: get_6d_euler_residual,
+        QRTComponentType.ComponentImage: get_image,
+        QRTComponentType.Component3d: get_3d_markers,
+        QRTComponentType.Component3dRes: get_3d_markers_residual,
+        QRTComponentType.Component3dNoLabels: get_3d_markers_no_label,
+        QRTComponentType.Component3dNoLabelsRes: get_3d_markers_no_label_residual,
+        QRTComponentType.Component2d: get_2d_markers,
+        QRTComponentType.Component2dLin: get_2d_markers_linearized,
+        QRTComponentType.ComponentSkeleton: get_skeletons,
+        # No getter, eager packets with gaze vectors keep their data
+        QRTComponentType.ComponentGazeVector: None,
+    }
+
+
+assert set(QRTPacket._getters) == set(QRTComponentType)
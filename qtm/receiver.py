@@ -1,7 +1,8 @@
 import logging
 
 from qtm.packet import QRTPacketType
-from qtm.packet import QRTPacket, QRTEvent
+from qtm.packet import QRTPacket
+from qtm.packet import packet_type_from_int, event_from_int
 from qtm.packet import RTheader, RTEvent, RTCommand
 
 LOG = logging.getLogger("qtm")
@@ -32,7 +33,7 @@ class Receiver(object):
         self._received_data = data
 
     def _parse_received(self, data, type_):
-        type_ = QRTPacketType(type_)
+        type_ = packet_type_from_int(type_)
 
         if (
             type_ == QRTPacketType.PacketError
@@ -44,7 +45,7 @@ class Receiver(object):
             data = QRTPacket(data)
         elif type_ == QRTPacketType.PacketEvent:
             event, = RTEvent.unpack(data)
-            data = QRTEvent(ord(event))
+            data = event_from_int(ord(event))
 
         try:
             self._handlers[type_](data)
@@ -0,0 +1,732 @@
+"""
+    Tests for QRTPacket
+"""
+
+import copy
+import pickle
+import struct
+
+import pytest
+
+from qtm.packet import (
+    QRTPacket,
+    QRTPacketType,
+    QRTComponentType,
+    RTDataQRTPacket,
+    RTComponentData,
+    RT3DComponent,
+    RT3DMarkerPosition,
+    RT3DMarkerPositionResidual,
+    RT3DMarkerPositionNoLabel,
+    RT3DMarkerPositionNoLabelResidual,
+    RTAnalogComponent,
+    RTAnalogDevice,
+    RTAnalogDeviceSingle,
+    RTSampleNumber,
+    RT6DComponent,
+    RT6DBodyPosition,
+    RT6DBodyRotation,
+    RT6DBodyResidual,
+    RT6DBodyEuler,
+    RT2DComponent,
+    RT2DCamera,
+    RT2DMarker,
+    RTForceComponent,
+    RTForcePlate,
+    RTForcePlateSingle,
+    RTForce,
+    RTSkeletonComponent,
+    RTSegmentCount,
+    RTSegmentId,
+    RTSegmentPosition,
+    RTSegmentRotation,
+    RTTimeComponent,
+    RTTime,
+    RTImageComponent,
+    RTImage,
+    RTGazeVectorComponent,
+)
+
+# pylint: disable=W0621, C0111, W0212
+
+
+def create_packet(*components, timestamp=1234, framenumber=5):
+    """ Build raw packet data from (component_type, payload) pairs """
+    data = RTDataQRTPacket.pack(timestamp, framenumber, len(components))
+    for component_type, payload in components:
+        data += RTComponentData.pack(
+            RTComponentData.size + len(payload), component_type.value
+        )
+        data += payload
+    return data
+
+
+def create_3d_payload(type_, markers):
+    payload = RT3DComponent.format.pack(len(markers), 0, 0)
+    for marker in markers:
+        payload += type_.format.pack(*marker)
+    return payload
+
+
+def test_header():
+    packet = QRTPacket(create_packet())
+
+    assert packet.timestamp == 1234
+    assert packet.framenumber == 5
+    assert packet.components == {}
+
+
+def test_components():
+    packet = QRTPacket(
+        create_packet(
+            (
+                QRTComponentType.Component3d,
+                create_3d_payload(RT3DMarkerPosition, [(1.0, 2.0, 3.0)]),
+            ),
+            (QRTComponentType.Component6d, create_6d_payload([])),
+        )
+    )
+
+    assert packet.components == {
+        QRTComponentType.Component3d: RTDataQRTPacket.size + RTComponentData.size,
+        QRTComponentType.Component6d: RTDataQRTPacket.size
+        + 2 * RTComponentData.size
+        + RT3DComponent.format.size
+        + RT3DMarkerPosition.format.size,
+    }
+
+
+def test_components_lookup():
+    packet = QRTPacket(
+        create_packet((QRTComponentType.Component6d, create_6d_payload([])))
+    )
+
+    assert QRTComponentType.Component6d in packet.components
+    assert QRTComponentType.Component3d not in packet.components
+    assert "6d" not in packet.components
+    assert packet.components.get(QRTComponentType.Component3d) is None
+    assert list(packet.components) == [QRTComponentType.Component6d]
+    assert len(packet.components) == 1
+    with pytest.raises(KeyError):
+        packet.components[QRTComponentType.Component3d]
+
+
+def test_components_other_enum():
+    packet = QRTPacket(
+        create_packet(
+            (QRTComponentType.ComponentAnalog, create_analog_payload([]))
+        )
+    )
+
+    assert QRTPacketType.PacketData.value == QRTComponentType.ComponentAnalog.value
+    assert QRTPacketType.PacketData not in packet.components
+    assert packet.components.get(QRTPacketType.PacketData) is None
+
+
+def test_components_wire_order():
+    packet = QRTPacket(
+        create_packet(
+            (QRTComponentType.Component6d, create_6d_payload([])),
+            (
+                QRTComponentType.Component3d,
+                create_3d_payload(RT3DMarkerPosition, []),
+            ),
+        )
+    )
+
+    assert list(packet.components) == [
+        QRTComponentType.Component6d,
+        QRTComponentType.Component3d,
+    ]
+
+
+@pytest.mark.parametrize("c_type", [0, 19, 1000])
+def test_unknown_component_type(c_type):
+    data = RTDataQRTPacket.pack(1234, 5, 1)
+    data += RTComponentData.pack(RTComponentData.size, c_type)
+
+    with pytest.raises(ValueError):
+        QRTPacket(data)
+
+
+def test_reset():
+    packet = QRTPacket(
+        create_packet((QRTComponentType.Component6d, create_6d_payload([])))
+    )
+
+    packet.reset(create_packet(timestamp=1, framenumber=2))
+
+    assert packet.timestamp == 1
+    assert packet.framenumber == 2
+    assert packet.components == {}
+    assert packet.get_6d() is None
+
+
+def test_acquire_release(mocker):
+    mocker.patch.object(QRTPacket, "_pool", [])
+    packet = QRTPacket.acquire(create_packet(framenumber=1))
+    packet.release()
+
+    reused = QRTPacket.acquire(create_packet(framenumber=2))
+
+    assert reused is packet
+    assert reused.framenumber == 2
+    assert QRTPacket.acquire(create_packet(framenumber=3)) is not packet
+
+
+def test_release_twice(mocker):
+    mocker.patch.object(QRTPacket, "_pool", [])
+    packet = QRTPacket(create_packet())
+
+    packet.release()
+    packet.release()
+
+    assert QRTPacket._pool == [packet]
+    first = QRTPacket.acquire(create_packet(framenumber=1))
+    second = QRTPacket.acquire(create_packet(framenumber=2))
+    assert first is packet
+    assert second is not first
+
+
+def test_release_after_reuse(mocker):
+    mocker.patch.object(QRTPacket, "_pool", [])
+    packet = QRTPacket(create_packet())
+    packet.release()
+
+    reused = QRTPacket.acquire(create_packet())
+    reused.release()
+
+    assert QRTPacket._pool == [packet]
+
+
+def test_release_subclass_pool(mocker):
+    mocker.patch.object(QRTPacket, "_pool", [])
+
+    class SubPacket(QRTPacket):
+        _pool = []
+
+    packet = SubPacket(create_packet())
+    packet.release()
+
+    assert SubPacket._pool == [packet]
+    assert QRTPacket._pool == []
+    assert SubPacket.acquire(create_packet()) is packet
+    assert type(QRTPacket.acquire(create_packet())) is QRTPacket
+
+
+def test_release_pool_size(mocker):
+    mocker.patch.object(QRTPacket, "_pool", [])
+    mocker.patch.object(QRTPacket, "_pool_size", 1)
+
+    QRTPacket(create_packet()).release()
+    QRTPacket(create_packet()).release()
+
+    assert len(QRTPacket._pool) == 1
+
+
+def test_pickle():
+    data = create_packet(
+        (
+            QRTComponentType.Component3d,
+            create_3d_payload(RT3DMarkerPosition, [(1.0, 2.0, 3.0)]),
+        )
+    )
+    packet = QRTPacket(data)
+
+    for clone in (pickle.loads(pickle.dumps(packet)), copy.deepcopy(packet)):
+        assert clone.framenumber == packet.framenumber
+        assert clone.components == packet.components
+        assert clone.get_3d_markers() == packet.get_3d_markers()
+
+
+def test_bytearray_resizable():
+    data = bytearray(
+        create_packet(
+            (
+                QRTComponentType.Component3d,
+                create_3d_payload(RT3DMarkerPosition, [(1.0, 2.0, 3.0)]),
+            )
+        )
+    )
+    packet = QRTPacket(data)
+    packet.get_3d_markers()
+
+    data.extend(b"\x00")
+
+
+def test_missing_component():
+    packet = QRTPacket(create_packet())
+
+    assert packet.get_3d_markers() is None
+
+
+@pytest.mark.parametrize(
+    "component_type,type_,getter,markers",
+    [
+        (
+            QRTComponentType.Component3d,
+            RT3DMarkerPosition,
+            QRTPacket.get_3d_markers,
+            [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)],
+        ),
+        (
+            QRTComponentType.Component3dRes,
+            RT3DMarkerPositionResidual,
+            QRTPacket.get_3d_markers_residual,
+            [(1.0, 2.0, 3.0, 0.5), (4.0, 5.0, 6.0, 0.25)],
+        ),
+        (
+            QRTComponentType.Component3dNoLabels,
+            RT3DMarkerPositionNoLabel,
+            QRTPacket.get_3d_markers_no_label,
+            [(1.0, 2.0, 3.0, 7), (4.0, 5.0, 6.0, 8)],
+        ),
+        (
+            QRTComponentType.Component3dNoLabelsRes,
+            RT3DMarkerPositionNoLabelResidual,
+            QRTPacket.get_3d_markers_no_label_residual,
+            [(1.0, 2.0, 3.0, 7, 0.5), (4.0, 5.0, 6.0, 8, 0.25)],
+        ),
+    ],
+)
+def test_get_3d_markers(component_type, type_, getter, markers):
+    packet = QRTPacket(
+        create_packet((component_type, create_3d_payload(type_, markers)))
+    )
+
+    info, result = getter(packet)
+
+    assert info.marker_count == len(markers)
+    assert result == [type_(*marker) for marker in markers]
+    assert all(isinstance(marker, type_) for marker in result)
+
+
+def test_get_3d_markers_empty():
+    packet = QRTPacket(
+        create_packet(
+            (
+                QRTComponentType.Component3d,
+                create_3d_payload(RT3DMarkerPosition, []),
+            )
+        )
+    )
+
+    info, result = packet.get_3d_markers()
+
+    assert info.marker_count == 0
+    assert result == []
+
+
+@pytest.mark.parametrize(
+    "component_type,payload,getter",
+    [
+        (
+            QRTComponentType.Component3d,
+            RT3DComponent.format.pack(3, 0, 0)
+            + RT3DMarkerPosition.format.pack(1.0, 2.0, 3.0) * 2,
+            QRTPacket.get_3d_markers,
+        ),
+        (
+            QRTComponentType.Component6d,
+            RT6DComponent.format.pack(2, 0, 0) + struct.pack("<12f", *range(12)),
+            QRTPacket.get_6d,
+        ),
+        (
+            QRTComponentType.ComponentTimecode,
+            RTTimeComponent.format.pack(2) + RTTime.format.pack(0, 1, 2),
+            QRTPacket.get_timecode,
+        ),
+        (
+            QRTComponentType.Component2d,
+            RT2DComponent.format.pack(1, 0, 0)
+            + RT2DCamera.format.pack(2, b"\x00")
+            + RT2DMarker.format.pack(1, 2, 3, 4),
+            QRTPacket.get_2d_markers,
+        ),
+    ],
+)
+def test_truncated_component(component_type, payload, getter):
+    packet = QRTPacket(create_packet((component_type, payload)))
+
+    with pytest.raises(struct.error):
+        getter(packet)
+
+
+def create_analog_payload(devices):
+    payload = RTAnalogComponent.format.pack(len(devices))
+    for device_id, sample_number, channels in devices:
+        sample_count = len(channels[0]) if channels else 0
+        payload += RTAnalogDevice.format.pack(device_id, len(channels), sample_count)
+        if sample_count > 0:
+            payload += RTSampleNumber.format.pack(sample_number)
+            for channel in channels:
+                payload += struct.pack("<%df" % sample_count, *channel)
+    return payload
+
+
+def test_get_analog():
+    devices = [
+        (1, 10, [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)]),
+        (2, 20, [(7.0,), (8.0,), (9.0,)]),
+    ]
+    packet = QRTPacket(
+        create_packet(
+            (QRTComponentType.ComponentAnalog, create_analog_payload(devices))
+        )
+    )
+
+    info, result = packet.get_analog()
+
+    assert info.device_count == 2
+    assert [
+        (device.id, sample_number.sample_number, channel.samples)
+        for device, sample_number, channel in result
+    ] == [
+        (1, 10, (1.0, 2.0, 3.0)),
+        (1, 10, (4.0, 5.0, 6.0)),
+        (2, 20, (7.0,)),
+        (2, 20, (8.0,)),
+        (2, 20, (9.0,)),
+    ]
+
+
+def test_get_analog_no_samples():
+    packet = QRTPacket(
+        create_packet(
+            (
+                QRTComponentType.ComponentAnalog,
+                create_analog_payload([(1, 10, [])]),
+            )
+        )
+    )
+
+    info, result = packet.get_analog()
+
+    assert info.device_count == 1
+    assert result == []
+
+
+def test_get_analog_single():
+    devices = [(1, (1.0, 2.0)), (2, (3.0, 4.0, 5.0))]
+    payload = RTAnalogComponent.format.pack(len(devices))
+    for device_id, samples in devices:
+        payload += RTAnalogDeviceSingle.format.pack(device_id, len(samples))
+        payload += struct.pack("<%df" % len(samples), *samples)
+    packet = QRTPacket(
+        create_packet((QRTComponentType.ComponentAnalogSingle, payload))
+    )
+
+    info, result = packet.get_analog_single()
+
+    assert info.device_count == 2
+    assert [(device.id, sample.samples) for device, sample in result] == devices
+
+
+POSITIONS = [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)]
+MATRICES = [tuple(float(i) for i in range(9)), tuple(float(i) for i in range(9, 18))]
+EULERS = [(10.0, 20.0, 30.0), (40.0, 50.0, 60.0)]
+RESIDUALS = [0.5, 0.25]
+
+
+def create_6d_payload(bodies):
+    payload = RT6DComponent.format.pack(len(bodies), 0, 0)
+    for body in bodies:
+        payload += struct.pack("<%df" % len(body), *body)
+    return payload
+
+
+def test_get_6d():
+    bodies = [position + matrix for position, matrix in zip(POSITIONS, MATRICES)]
+    packet = QRTPacket(
+        create_packet((QRTComponentType.Component6d, create_6d_payload(bodies)))
+    )
+
+    info, result = packet.get_6d()
+
+    assert info.body_count == 2
+    assert result == [
+        (RT6DBodyPosition(*position), RT6DBodyRotation(matrix))
+        for position, matrix in zip(POSITIONS, MATRICES)
+    ]
+
+
+def test_get_6d_residual():
+    bodies = [
+        position + matrix + (residual,)
+        for position, matrix, residual in zip(POSITIONS, MATRICES, RESIDUALS)
+    ]
+    packet = QRTPacket(
+        create_packet((QRTComponentType.Component6dRes, create_6d_payload(bodies)))
+    )
+
+    info, result = packet.get_6d_residual()
+
+    assert info.body_count == 2
+    assert result == [
+        (
+            RT6DBodyPosition(*position),
+            RT6DBodyRotation(matrix),
+            RT6DBodyResidual(residual),
+        )
+        for position, matrix, residual in zip(POSITIONS, MATRICES, RESIDUALS)
+    ]
+
+
+def test_get_6d_euler():
+    bodies = [position + euler for position, euler in zip(POSITIONS, EULERS)]
+    packet = QRTPacket(
+        create_packet((QRTComponentType.Component6dEuler, create_6d_payload(bodies)))
+    )
+
+    info, result = packet.get_6d_euler()
+
+    assert info.body_count == 2
+    assert result == [
+        (RT6DBodyPosition(*position), RT6DBodyEuler(*euler))
+        for position, euler in zip(POSITIONS, EULERS)
+    ]
+
+
+def test_get_6d_euler_residual():
+    bodies = [
+        position + euler + (residual,)
+        for position, euler, residual in zip(POSITIONS, EULERS, RESIDUALS)
+    ]
+    packet = QRTPacket(
+        create_packet(
+            (QRTComponentType.Component6dEulerRes, create_6d_payload(bodies))
+        )
+    )
+
+    info, result = packet.get_6d_euler_residual()
+
+    assert info.body_count == 2
+    assert result == [
+        (
+            RT6DBodyPosition(*position),
+            RT6DBodyEuler(*euler),
+            RT6DBodyResidual(residual),
+        )
+        for position, euler, residual in zip(POSITIONS, EULERS, RESIDUALS)
+    ]
+
+
+CAMERAS = [
+    [(1, 2, 3, 4), (5, 6, 7, 8)],
+    [],
+    [(9, 10, 11, 12)],
+]
+
+
+def create_2d_payload(cameras):
+    payload = RT2DComponent.format.pack(len(cameras), 0, 0)
+    for markers in cameras:
+        payload += RT2DCamera.format.pack(len(markers), b"\x00")
+        for marker in markers:
+            payload += RT2DMarker.format.pack(*marker)
+    return payload
+
+
+@pytest.mark.parametrize(
+    "component_type,getter",
+    [
+        (QRTComponentType.Component2d, QRTPacket.get_2d_markers),
+        (QRTComponentType.Component2dLin, QRTPacket.get_2d_markers_linearized),
+    ],
+)
+def test_get_2d_markers(component_type, getter):
+    packet = QRTPacket(create_packet((component_type, create_2d_payload(CAMERAS))))
+
+    info, result = getter(packet)
+
+    assert info.camera_count == 3
+    assert result == [
+        [RT2DMarker(*marker) for marker in markers] for markers in CAMERAS
+    ]
+
+
+@pytest.mark.parametrize("index", [0, 1, 2])
+def test_get_2d_markers_index(index):
+    packet = QRTPacket(
+        create_packet((QRTComponentType.Component2d, create_2d_payload(CAMERAS)))
+    )
+
+    _, result = packet.get_2d_markers(index=index)
+
+    assert result == [[RT2DMarker(*marker) for marker in CAMERAS[index]]]
+
+
+def test_get_2d_markers_index_out_of_range():
+    packet = QRTPacket(
+        create_packet((QRTComponentType.Component2d, create_2d_payload(CAMERAS)))
+    )
+
+    _, result = packet.get_2d_markers(index=len(CAMERAS))
+
+    assert result == []
+
+
+FORCES = [
+    tuple(float(i) for i in range(9)),
+    tuple(float(i) for i in range(9, 18)),
+    tuple(float(i) for i in range(18, 27)),
+]
+
+
+def test_get_force():
+    plates = [(1, FORCES[:2]), (2, FORCES[2:])]
+    payload = RTForceComponent.format.pack(len(plates))
+    for plate_id, forces in plates:
+        payload += RTForcePlate.format.pack(plate_id, len(forces), 100)
+        for force in forces:
+            payload += RTForce.format.pack(*force)
+    packet = QRTPacket(create_packet((QRTComponentType.ComponentForce, payload)))
+
+    info, result = packet.get_force()
+
+    assert info.plate_count == 2
+    assert result == [
+        (RTForcePlate(plate_id, len(forces), 100), [RTForce(*f) for f in forces])
+        for plate_id, forces in plates
+    ]
+
+
+def test_get_force_single():
+    payload = RTForceComponent.format.pack(2)
+    for plate_id, force in zip((1, 2), FORCES):
+        payload += RTForcePlateSingle.format.pack(plate_id)
+        payload += RTForce.format.pack(*force)
+    packet = QRTPacket(
+        create_packet((QRTComponentType.ComponentForceSingle, payload))
+    )
+
+    info, result = packet.get_force_single()
+
+    assert info.plate_count == 2
+    assert result == [
+        (RTForcePlateSingle(plate_id), RTForce(*force))
+        for plate_id, force in zip((1, 2), FORCES)
+    ]
+
+
+SKELETONS = [
+    [
+        (1, (1.0, 2.0, 3.0), (0.0, 0.0, 0.0, 1.0)),
+        (2, (4.0, 5.0, 6.0), (0.5, 0.5, 0.5, 0.5)),
+    ],
+    [],
+    [(7, (7.0, 8.0, 9.0), (1.0, 0.0, 0.0, 0.0))],
+]
+
+
+def test_get_skeletons():
+    payload = RTSkeletonComponent.format.pack(len(SKELETONS))
+    for segments in SKELETONS:
+        payload += RTSegmentCount.format.pack(len(segments))
+        for segment_id, position, rotation in segments:
+            payload += RTSegmentId.format.pack(segment_id)
+            payload += RTSegmentPosition.format.pack(*position)
+            payload += RTSegmentRotation.format.pack(*rotation)
+    packet = QRTPacket(create_packet((QRTComponentType.ComponentSkeleton, payload)))
+
+    info, result = packet.get_skeletons()
+
+    assert info.skeleton_count == 3
+    assert result == [
+        [
+            (segment_id, RTSegmentPosition(*position), RTSegmentRotation(*rotation))
+            for segment_id, position, rotation in segments
+        ]
+        for segments in SKELETONS
+    ]
+
+
+def test_get_timecode():
+    timecodes = [(0, 1, 2), (1, 3, 4)]
+    payload = RTTimeComponent.format.pack(len(timecodes))
+    for timecode in timecodes:
+        payload += RTTime.format.pack(*timecode)
+    packet = QRTPacket(create_packet((QRTComponentType.ComponentTimecode, payload)))
+
+    info, result = packet.get_timecode()
+
+    assert info.timecode_count == 2
+    assert result == [RTTime(*timecode) for timecode in timecodes]
+
+
+def test_get_image():
+    images = [(1, b"\x01\x02\x03\x04"), (2, b"\x05\x06")]
+    payload = RTImageComponent.format.pack(len(images))
+    for camera_id, image in images:
+        payload += RTImage.format.pack(camera_id, 2, 2, 1, 0, 0, 1, 1, len(image))
+        payload += image
+    packet = QRTPacket(create_packet((QRTComponentType.ComponentImage, payload)))
+
+    info, result = packet.get_image()
+
+    assert info.image_count == 2
+    assert [(image_info.id, bytes(image)) for image_info, image in result] == images
+    assert all(isinstance(image, memoryview) for _, image in result)
+
+
+def test_eager():
+    data = create_packet(
+        (
+            QRTComponentType.Component3d,
+            create_3d_payload(RT3DMarkerPosition, [(1.0, 2.0, 3.0)]),
+        ),
+        (QRTComponentType.Component2d, create_2d_payload(CAMERAS)),
+    )
+    lazy = QRTPacket(data)
+
+    packet = QRTPacket(data, eager=True)
+
+    assert packet.data is None
+    assert packet.get_3d_markers() == lazy.get_3d_markers()
+    assert packet.get_2d_markers() == lazy.get_2d_markers()
+    assert packet.get_6d() is None
+
+
+@pytest.mark.parametrize("index", [-1, 0, 1, 2, 3])
+def test_eager_2d_markers_index(index):
+    data = create_packet((QRTComponentType.Component2d, create_2d_payload(CAMERAS)))
+
+    packet = QRTPacket(data, eager=True)
+
+    assert packet.get_2d_markers(index=index) == QRTPacket(data).get_2d_markers(
+        index=index
+    )
+
+
+def test_eager_image():
+    payload = RTImageComponent.format.pack(1)
+    payload += RTImage.format.pack(1, 2, 2, 1, 0, 0, 1, 1, 2)
+    payload += b"\x05\x06"
+
+    packet = QRTPacket(
+        create_packet((QRTComponentType.ComponentImage, payload)), eager=True
+    )
+
+    _, [(_, image)] = packet.get_image()
+    assert image == b"\x05\x06"
+    assert isinstance(image, memoryview)
+
+
+def test_eager_getters_cover_component_types():
+    assert set(QRTPacket._getters) == set(QRTComponentType)
+
+
+def test_eager_keeps_data_for_unparsed_components():
+    data = create_packet(
+        (
+            QRTComponentType.Component3d,
+            create_3d_payload(RT3DMarkerPosition, [(1.0, 2.0, 3.0)]),
+        ),
+        (QRTComponentType.ComponentGazeVector, RTGazeVectorComponent.format.pack(0)),
+    )
+
+    packet = QRTPacket(data, eager=True)
+
+    assert packet.data is data
+    assert QRTComponentType.ComponentGazeVector in packet.components
+    assert packet.get_3d_markers() == QRTPacket(data).get_3d_markers()
@@ -0,0 +1,80 @@
+"""
+    Tests for Receiver
+"""
+
+import pytest
+
+from qtm.receiver import Receiver
+from qtm.packet import QRTPacketType, QRTEvent, RTheader, RTDataQRTPacket
+
+# pylint: disable=W0621, C0111, W0212
+
+
+def create_message(type_, payload):
+    return RTheader.pack(RTheader.size + len(payload), type_) + payload
+
+
+@pytest.fixture
+def received():
+    return []
+
+
+@pytest.fixture
+def receiver(received):
+    return Receiver(
+        {
+            QRTPacketType.PacketCommand: received.append,
+            QRTPacketType.PacketEvent: received.append,
+            QRTPacketType.PacketData: received.append,
+        }
+    )
+
+
+def test_command(receiver, received):
+    receiver.data_received(
+        create_message(QRTPacketType.PacketCommand.value, b"Command\x00")
+    )
+
+    assert received == [b"Command"]
+
+
+def test_event(receiver, received):
+    receiver.data_received(
+        create_message(
+            QRTPacketType.PacketEvent.value,
+            bytes([QRTEvent.EventCaptureStarted.value]),
+        )
+    )
+
+    assert received == [QRTEvent.EventCaptureStarted]
+
+
+def test_data(receiver, received):
+    receiver.data_received(
+        create_message(QRTPacketType.PacketData.value, RTDataQRTPacket.pack(1, 2, 0))
+    )
+
+    assert len(received) == 1
+    assert received[0].framenumber == 2
+
+
+def test_split_messages(receiver, received):
+    data = create_message(QRTPacketType.PacketCommand.value, b"First\x00")
+    data += create_message(QRTPacketType.PacketCommand.value, b"Second\x00")
+
+    receiver.data_received(data[:10])
+    receiver.data_received(data[10:])
+
+    assert received == [b"First", b"Second"]
+
+
+def test_unknown_packet_type(receiver):
+    with pytest.raises(ValueError):
+        receiver.data_received(create_message(100, b""))
+
+
+def test_unknown_event(receiver):
+    with pytest.raises(ValueError):
+        receiver.data_received(
+            create_message(QRTPacketType.PacketEvent.value, bytes([100]))
+        )